@@ -1,367 +1,42 @@
 import streamlit as st
-import pandas as pd
-import random
 import time
-import base64
+import hashlib
+
+from report import create_html_report
+from scoring import OFFICIAL_HANDLE, RISK_THRESHOLD_HIGH, RISK_THRESHOLD_MEDIUM, calculate_risk_score
 
 # --- Configuration ---
-OFFICIAL_HANDLE = "Odisha_Police"
 OFFICIAL_NAME = "Odisha Police"
-RISK_THRESHOLD_HIGH = 70
-RISK_THRESHOLD_MEDIUM = 40
-
-# --- Helper Functions ---
-
-def get_similarity_score(suspect_handle, official_handle):
-    """
-    Calculates a score based on handle similarity.
-    Max score of 1.0 (100% match) for perfect handle match.
-    Specific logic to detect common typos like '0' (zero) for 'O' (letter).
-    """
-    suspect_lower = suspect_handle.lower().strip()
-    official_lower = official_handle.lower().strip()
-
-    if suspect_lower == official_lower:
-        return 1.0
-    
-    # Critical typo: '0' (zero) substituted for 'o' (letter)
-    if suspect_lower.replace('0', 'o', 1) == official_lower and '0' in suspect_lower:
-         return 0.99
-    
-    # Generic single-character difference check
-    if len(suspect_handle) == len(official_handle) and sum(a != b for a, b in zip(suspect_lower, official_lower)) == 1:
-        return 0.90
-        
-    return 0.20
-
-
-def keyword_scan_score(post_content):
-    """Mocks scanning post content for high-risk fraud keywords (Behavioral Module)."""
-    # Expanded list of fraud keywords
-    fraud_keywords = ["otp", "wallet", "send money", "urgent funds", "transfer now", "fine", "penalty", "account frozen", "kyc update", "click link", "tax refund", "jail"]
-    risk = 0
-    
-    # Specific high-risk phrase detection
-    if "urgent" in post_content.lower() and ("money" in post_content.lower() or "fund" in post_content.lower()):
-        risk += 25  
-    
-    # Generic keyword detection
-    for keyword in fraud_keywords:
-        if keyword in post_content.lower():
-            risk += 15
-            
-    return min(risk, 60) # Max raw risk contribution from generic behavior is 60
-
-def calculate_risk_score(handle, recent_posts, is_established_account, domain_age_risk, profile_pic_stolen, urgency_tone_risk, phishing_link_risk):
-    """
-    Calculates the overall Impersonation Risk Score (Max 100) by aggregating scores from all modules.
-    """
-    
-    identity_risk = 0  # Max 45 points
-    behavior_risk = 0  # Max 40 points
-    network_risk = 0   # Max 15 points
-    
-    # 1. Identity Module (Max 45 points)
-    identity_score = get_similarity_score(handle, OFFICIAL_HANDLE)
-    
-    if identity_score == 1.0:
-        identity_risk = 0
-    elif identity_score == 0.99:
-        # Near perfect match (typo like 0 for O) is highest risk from identity
-        identity_risk = 43 + random.randint(0, 2) # 43-45
-    elif identity_score == 0.90:
-        # Single character difference
-        identity_risk = 25 + random.randint(0, 5) # 25-30
-    else:
-        identity_risk = 5 + random.randint(0, 5) # Low identity risk
-    
-    # Confidence Score Calculation (Mock)
-    if identity_score == 1.0 or identity_score <= 0.20:
-        # High confidence in low/perfect identity match
-        confidence_score = random.uniform(90.0, 99.9)
-    elif identity_score >= 0.90:
-        # Lower confidence when dealing with subtle typos
-        confidence_score = random.uniform(70.0, 89.9)
-    else:
-        confidence_score = random.uniform(50.0, 69.9) 
-
-
-    # 2. Behavioral Module (Max 40 points)
-    behavior_risk_raw = keyword_scan_score(recent_posts)
-    
-    # Feature 1: Urgency Tone (Max 15 points) - NEW
-    urgency_points = 0
-    if urgency_tone_risk == "High Urgency (Threat/Panic)":
-        urgency_points = 15
-    elif urgency_tone_risk == "Medium Urgency (Time Pressure)":
-        urgency_points = 7
-        
-    # Scale generic keyword score (max 60) to max 25 points, leaving 15 points for Urgency Tone
-    keyword_points = int(behavior_risk_raw * (25 / 60))
-
-    behavior_risk = keyword_points + urgency_points
-    behavior_risk = min(behavior_risk, 40)
-    
-    # 3. Network/Metadata Score (Max 15 points)
-    
-    account_age_days = random.randint(300, 500)
-    if not is_established_account:
-        # 5 points for new account (max 5/15)
-        network_risk += 5 + random.randint(0, 2)
-        account_age_days = random.randint(1, 90)
-        
-    # Network Feature 1a: External Link Domain Age Check (Max 3 points)
-    domain_age_points = 0
-    if domain_age_risk == "High Risk (New/Suspicious Domain)":
-        domain_age_points = 3 
-    elif domain_age_risk == "Medium Risk (Recently Updated Domain)":
-        domain_age_points = 1
-    
-    # Network Feature 1b: Phishing Link/Homoglyph Check (Max 3 points) - NEW FEATURE
-    phishing_points = 0
-    if phishing_link_risk == "Homoglyph/Typosquatting Detected":
-        phishing_points = 3
-    elif phishing_link_risk == "Malicious Domain Structure Detected":
-        phishing_points = 1
-    
-    # Network Feature 2: Stolen Profile Picture Check (Max 4 points)
-    stolen_pic_points = 0
-    if profile_pic_stolen == "Yes (Stolen/Official Image Match)":
-        stolen_pic_points = 4
-    
-    network_risk += domain_age_points + phishing_points + stolen_pic_points
-    # Ensure network risk maxes out at 15
-    network_risk = min(network_risk, 15)
-    
-    final_score_raw = identity_risk + behavior_risk + network_risk 
-    
-    # Add a small random jitter and cap the score
-    final_score = min(final_score_raw + random.randint(-5, 5), 100)
-    final_score = max(final_score, 0)
-    
-    return final_score, {
-        "Handle Similarity Score (%)": round(identity_score * 100, 2),
-        "Identity Risk Points (Max 45)": identity_risk,
-        "Keyword Scan Points (Max 25)": keyword_points,
-        "Urgency Tone Points (Max 15)": urgency_points, # NEW
-        "Behavioral Risk Points (Max 40)": behavior_risk,
-        "Network/Metadata Risk Points (Max 15)": network_risk,
-        "Account Age (Days)": account_age_days,
-        "Domain Age Risk Points": domain_age_points,
-        "Phishing Link Points": phishing_points, # NEW
-        "Stolen Picture Risk Points": stolen_pic_points,
-        "Confidence Score (%)": round(confidence_score, 2) 
-    }
+DEBUG_SIMULATE_LATENCY = False # Set True to re-enable the demo "processing" delay
 
 # --- Dynamic Action Suggestion Logic ---
+# (suggestion text, Streamlit style, risk label) per risk band, shared across calls
+_HIGH_RESULT = (
+    "🚨 *IMMEDIATE TAKEDOWN & FORENSIC TRACE:* Initiate platform-specific emergency takedown protocol. Begin forensic tracing of associated wallet addresses and IP logs.", 
+    "error", # Corresponds to st.error
+    'HIGH RISK: IMMEDIATE TAKEDOWN REQUIRED'
+)
+_MED_RESULT = (
+    "⚠ *MANDATORY MANUAL REVIEW & MONITORING:* Escalate to a Level 2 Analyst for mandatory human review. Set up automated monitoring for further post activity over the next 48 hours.",
+    "warning", # Corresponds to st.warning
+    'MEDIUM RISK: INVESTIGATE URGENTLY'
+)
+_LOW_RESULT = (
+    "✅ *SCHEDULED RE-EVALUATION:* No immediate action required. Profile will be marked for re-evaluation in 7 days to check for any changes in risk factors or behavioral patterns.",
+    "info", # Corresponds to st.info
+    'LOW RISK: MONITOR'
+)
+
 def get_action_suggestion(risk_score):
     """Provides specific next steps and corresponding Streamlit style based on the risk score."""
-    if risk_score >= RISK_THRESHOLD_HIGH:
-        return (
-            "🚨 *IMMEDIATE TAKEDOWN & FORENSIC TRACE:* Initiate platform-specific emergency takedown protocol. Begin forensic tracing of associated wallet addresses and IP logs.", 
-            "error", # Corresponds to st.error
-            'HIGH RISK: IMMEDIATE TAKEDOWN REQUIRED'
-        )
-    elif risk_score >= RISK_THRESHOLD_MEDIUM:
-        return (
-            "⚠ *MANDATORY MANUAL REVIEW & MONITORING:* Escalate to a Level 2 Analyst for mandatory human review. Set up automated monitoring for further post activity over the next 48 hours.",
-            "warning", # Corresponds to st.warning
-            'MEDIUM RISK: INVESTIGATE URGENTLY'
-        )
-    else:
-        return (
-            "✅ *SCHEDULED RE-EVALUATION:* No immediate action required. Profile will be marked for re-evaluation in 7 days to check for any changes in risk factors or behavioral patterns.",
-            "info", # Corresponds to st.info
-            'LOW RISK: MONITOR'
-        )
-
-# --- HTML Generator Function (For PDF Report Download) ---
-def create_html_report(final_score, breakdown, suspect_url, suspect_handle, suspect_posts, suggestion_text, risk_label):
-    """Generates a styled HTML string for the downloadable forensic report."""
-    
-    # Determine Risk Color for the report
-    if final_score >= RISK_THRESHOLD_HIGH:
-        risk_color = '#CC0000' # Red
-    elif final_score >= RISK_THRESHOLD_MEDIUM:
-        risk_color = '#FFCC00' # Yellow/Amber
-    else:
-        risk_color = '#008000' # Green
-    
-    confidence = breakdown.get("Confidence Score (%)", "N/A")
-    
-    # Construct the HTML content using professional styling
-    html_content = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <title>Hawk-Eye AI Forensic Report</title>
-        <style>
-            /* Professional, clean CSS structure for printing */
-            body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; color: #333; line-height: 1.6; }}
-            .container {{ width: 850px; margin: 0 auto; border: 1px solid #ccc; padding: 30px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }}
-            
-            /* Header */
-            .header {{ background-color: #2c3e50; color: white; padding: 20px; text-align: center; margin-bottom: 20px; border-radius: 5px; }}
-            .header h1 {{ margin: 0; font-size: 26px; }}
-            .header p {{ margin: 5px 0 0; font-size: 14px; opacity: 0.9; }}
-            
-            /* Section Styling */
-            h2 {{ border-bottom: 2px solid #3498db; padding-bottom: 5px; margin-top: 25px; color: #34495e; font-size: 20px; }}
-            
-            /* Risk Summary Box */
-            .risk-summary-box {{ 
-                display: flex; 
-                justify-content: space-between; 
-                align-items: center;
-                padding: 15px 20px; 
-                margin-bottom: 20px; 
-                border-radius: 8px; 
-                border: 2px solid {risk_color};
-                background-color: #f4f6f7;
-            }}
-            .risk-score {{ font-size: 36px; font-weight: bold; color: {risk_color}; }}
-            .risk-label {{ font-size: 20px; font-weight: bold; color: #333; }}
-            
-            /* Table Styling */
-            table {{ width: 100%; border-collapse: collapse; margin-top: 10px; }}
-            th, td {{ border: 1px solid #ddd; padding: 12px; text-align: left; font-size: 14px; }}
-            th {{ background-color: #ecf0f1; color: #34495e; }}
-            .value-column {{ font-weight: bold; width: 30%; }}
-
-            /* Action Suggestion Box */
-            .action-suggestion {{
-                background-color: #fcf8e3;
-                border: 1px solid #f9d863;
-                color: #8a6d3b;
-                padding: 15px;
-                margin-top: 15px;
-                border-radius: 5px;
-            }}
-
-            /* Post Content Block */
-            .post-content {{ 
-                background-color: #ecf0f1; 
-                border-left: 5px solid #3498db; 
-                padding: 15px; 
-                margin-top: 10px;
-                white-space: pre-wrap;
-                font-style: italic;
-            }}
-
-            /* Footer */
-            .footer {{ text-align: center; margin-top: 40px; font-size: 12px; color: #7f8c8d; }}
-
-            /* Specific styling for the risk label color */
-            .risk-value {{ color: {risk_color}; }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <div class="header">
-                <h1>🚨 HAWK-EYE AI FORENSIC REPORT</h1>
-                <p>Instant Deception Detector | Generated on: {time.strftime('%Y-%m-%d %H:%M:%S')}</p>
-            </div>
-
-            <h2>1. Final Impersonation Risk Summary</h2>
-            <div class="risk-summary-box">
-                <div>
-                    <div class="risk-label">Risk Level:</div>
-                    <div class="risk-score risk-value">{risk_label}</div>
-                </div>
-                <div style="text-align: right;">
-                    <div class="risk-label">Calculated Risk Score:</div>
-                    <div class="risk-score risk-value">{final_score}%</div>
-                </div>
-            </div>
-            
-            <div class="action-suggestion">
-                <strong>Action Suggestion:</strong> {suggestion_text}
-            </div>
-
-            <h2>2. Suspect Profile & Reference</h2>
-            <table>
-                <tr>
-                    <th>Field</th>
-                    <th class="value-column">Value</th>
-                </tr>
-                <tr>
-                    <td>*Suspect URL*</td>
-                    <td class="value-column"><a href="{suspect_url}" target="_blank">{suspect_url}</a></td>
-                </tr>
-                <tr>
-                    <td>*Suspect Handle*</td>
-                    <td class="value-column">{suspect_handle}</td>
-                </tr>
-                <tr>
-                    <td>*Official Handle Reference*</td>
-                    <td class="value-column">{OFFICIAL_HANDLE}</td>
-                </tr>
-            </table>
-
-            <h2>3. Detailed Risk Breakdown (Max 100 Points)</h2>
-            <table>
-                <tr>
-                    <th>Risk Factor</th>
-                    <th>Score Detail</th>
-                    <th class="value-column">Points Earned</th>
-                </tr>
-                <tr>
-                    <td>*Identity Risk (Max 45)*</td>
-                    <td>Handle Similarity: {breakdown.get("Handle Similarity Score (%)")}%</td>
-                    <td class="value-column">{breakdown.get("Identity Risk Points (Max 45)")}</td>
-                </tr>
-                <tr>
-                    <td>*Behavioral Risk (Max 40)*</td>
-                    <td>
-                        Keyword Scan Points: {breakdown.get("Keyword Scan Points (Max 25)")}<br>
-                        *Urgency Tone Points (NEW)*: {breakdown.get("Urgency Tone Points (Max 15)")}
-                    </td>
-                    <td class="value-column">{breakdown.get("Behavioral Risk Points (Max 40)")}</td>
-                </tr>
-                <tr>
-                    <td>*Network/Metadata Risk (Max 15)*</td>
-                    <td>
-                        Account Age: {breakdown.get("Account Age (Days)")} days<br>
-                        Domain Age Risk Points: {breakdown.get("Domain Age Risk Points")}<br>
-                        *Phishing Link Points (NEW)*: {breakdown.get("Phishing Link Points")}<br>
-                        Stolen Pic Risk Points: {breakdown.get("Stolen Picture Risk Points")}
-                    </td>
-                    <td class="value-column">{breakdown.get("Network/Metadata Risk Points (Max 15)")}</td>
-                </tr>
-                <tr>
-                    <td style="background-color: #dbe4f1; font-weight: bold;">*AI Confidence Score*</td>
-                    <td style="background-color: #dbe4f1;">Model's certainty in the calculated risk.</td>
-                    <td class="value-column" style="background-color: #dbe4f1;">{confidence}%</td>
-                </tr>
-                <tr style="background-color: #e5e7e9; font-weight: bold;">
-                    <td>*TOTAL RISK SCORE*</td>
-                    <td></td>
-                    <td class="value-column">{final_score} / 100</td>
-                </tr>
-            </table>
-
-            <h2>4. Evidential Content</h2>
-            <p><strong>Recent Post Content Scanned:</strong></p>
-            <div class="post-content">
-                {suspect_posts}
-            </div>
-
-            <div class="footer">
-                This document is a machine-generated forensic snapshot and is intended for official use only.
-            </div>
-        </div>
-    </body>
-    </html>
-    """
-    return html_content
+    return _HIGH_RESULT if risk_score >= RISK_THRESHOLD_HIGH else _MED_RESULT if risk_score >= RISK_THRESHOLD_MEDIUM else _LOW_RESULT
 
 # --- Streamlit UI ---
 
 st.set_page_config(layout="wide", page_title="Hawk-Eye AI: Instant Deception Detector")
 
 # Custom CSS for the dashboard look and feel (Dark Theme)
-st.markdown("""
+_APP_CSS = """
 <style>
 .stApp {
     background-color: #0d1117;
@@ -421,10 +96,15 @@ div[data-testid*="stRadio"] label p {
     margin-bottom: 20px;
 }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Application header markup
+_APP_HEADER = '<div class="header-box"><h1>🚨 Hawk-Eye AI: Impersonation Detector</h1><h3>Instant Deception Detector</h3></div>'
+
+st.markdown(_APP_CSS, unsafe_allow_html=True)
 
 # Application Header
-st.markdown('<div class="header-box"><h1>🚨 Hawk-Eye AI: Impersonation Detector</h1><h3>Instant Deception Detector</h3></div>', unsafe_allow_html=True)
+st.markdown(_APP_HEADER, unsafe_allow_html=True)
 
 # Input Section
 with st.container():
@@ -522,7 +202,8 @@ with st.container():
                 del st.session_state.final_score
         else:
             with st.spinner("Analyzing profile across Identity, Behavior, and Network Modules..."):
-                time.sleep(2) # Simulate processing time
+                if DEBUG_SIMULATE_LATENCY:
+                    time.sleep(2) # Simulate processing time
                 
                 # --- Run Analysis ---
                 final_score, breakdown = calculate_risk_score(
@@ -587,30 +268,56 @@ if 'final_score' in st.session_state:
     st.markdown("---")
     st.subheader("Analysis Breakdown")
     
-    # Prepare data for display with NEW features
-    display_breakdown = [
-        {"Metric": "Identity Risk Points (Max 45)", "Value": breakdown.get("Identity Risk Points (Max 45)")},
-        {"Metric": "Handle Similarity Score (%)", "Value": f"{breakdown.get('Handle Similarity Score (%)')}%"},
-        {"Metric": "Keyword Scan Points (Max 25)", "Value": breakdown.get("Keyword Scan Points (Max 25)")},
-        {"Metric": "*Urgency Tone Points (NEW)*", "Value": breakdown.get("Urgency Tone Points (Max 15)")},
-        {"Metric": "Behavioral Risk Points (Total)", "Value": breakdown.get("Behavioral Risk Points (Max 40)")},
-        {"Metric": "Account Age (Days)", "Value": breakdown.get("Account Age (Days)")},
-        {"Metric": "Domain Age Risk Points", "Value": breakdown.get("Domain Age Risk Points")},
-        {"Metric": "*Phishing Link Points (NEW)*", "Value": breakdown.get("Phishing Link Points")},
-        {"Metric": "Stolen Picture Risk Points", "Value": breakdown.get("Stolen Picture Risk Points")},
-        {"Metric": "Network/Metadata Risk Points (Total)", "Value": breakdown.get("Network/Metadata Risk Points (Max 15)")},
-    ]
+    # Prepare data for display with NEW features, built column-wise
+    metrics = (
+        "Identity Risk Points (Max 45)",
+        "Handle Similarity Score (%)",
+        "Keyword Scan Points (Max 25)",
+        "*Urgency Tone Points (NEW)*",
+        "Behavioral Risk Points (Total)",
+        "Account Age (Days)",
+        "Domain Age Risk Points",
+        "*Phishing Link Points (NEW)*",
+        "Stolen Picture Risk Points",
+        "Network/Metadata Risk Points (Total)",
+    )
+    values = (
+        breakdown.get("Identity Risk Points (Max 45)"),
+        f"{breakdown.get('Handle Similarity Score (%)')}%",
+        breakdown.get("Keyword Scan Points (Max 25)"),
+        breakdown.get("Urgency Tone Points (Max 15)"),
+        breakdown.get("Behavioral Risk Points (Max 40)"),
+        breakdown.get("Account Age (Days)"),
+        breakdown.get("Domain Age Risk Points"),
+        breakdown.get("Phishing Link Points"),
+        breakdown.get("Stolen Picture Risk Points"),
+        breakdown.get("Network/Metadata Risk Points (Max 15)"),
+    )
 
-    st.dataframe(pd.DataFrame(display_breakdown), use_container_width=True, hide_index=True)
+    import pandas as pd # Deferred: only needed once results are shown, keeps cold start light
+    st.dataframe(pd.DataFrame({"Metric": metrics, "Value": values}), use_container_width=True, hide_index=True)
 
 
     # --- GENERATE HTML FOR PDF DOWNLOAD ---
-    html_content = create_html_report(final_score, breakdown, suspect_url, suspect_handle, suspect_posts, suggestion_text, risk_label)
+    # Only rebuild the report when the analysis changed; any widget interaction
+    # (including clicking the download button) reruns this whole script.
+    report_key = (
+        final_score,
+        suspect_url,
+        suspect_handle,
+        hashlib.blake2b(suspect_posts.encode('utf-8'), digest_size=16).digest(),
+        tuple(breakdown.items()),
+    )
+    if st.session_state.get('_report_key') != report_key:
+        html_content = create_html_report(final_score, breakdown, suspect_url, suspect_handle, suspect_posts, suggestion_text, risk_label)
+        st.session_state['_report_bytes'] = html_content.encode('utf-8')
+        st.session_state['_report_key'] = report_key
+    report_bytes = st.session_state['_report_bytes']
 
     # --- FINAL DOWNLOAD BUTTON ---
     st.download_button(
         label="Download Professional Report (HTML)",
-        data=html_content,
+        data=report_bytes,
         file_name="Forensic_Report_HawkEyeAI.html", 
         mime="text/html",
         key="download_button_v4"
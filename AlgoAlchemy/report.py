@@ -0,0 +1,223 @@
+"""
+Hawk-Eye AI forensic report rendering.
+
+Builds the downloadable HTML report for the Streamlit app (app.py). The
+templates live here rather than in the app script so they are expanded
+once per process instead of on every Streamlit rerun.
+"""
+import time
+
+from scoring import OFFICIAL_HANDLE, RISK_THRESHOLD_HIGH, RISK_THRESHOLD_MEDIUM
+
+# --- HTML Generator Function (For PDF Report Download) ---
+# Report <head>: only varies by risk color, so it is expanded once per risk band below
+_REPORT_HEAD_TEMPLATE = """
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <title>Hawk-Eye AI Forensic Report</title>
+        <style>
+            /* Professional, clean CSS structure for printing */
+            body {{ font-family: Arial, sans-serif; margin: 0; padding: 20px; color: #333; line-height: 1.6; }}
+            .container {{ width: 850px; margin: 0 auto; border: 1px solid #ccc; padding: 30px; box-shadow: 0 0 10px rgba(0,0,0,0.1); }}
+            
+            /* Header */
+            .header {{ background-color: #2c3e50; color: white; padding: 20px; text-align: center; margin-bottom: 20px; border-radius: 5px; }}
+            .header h1 {{ margin: 0; font-size: 26px; }}
+            .header p {{ margin: 5px 0 0; font-size: 14px; opacity: 0.9; }}
+            
+            /* Section Styling */
+            h2 {{ border-bottom: 2px solid #3498db; padding-bottom: 5px; margin-top: 25px; color: #34495e; font-size: 20px; }}
+            
+            /* Risk Summary Box */
+            .risk-summary-box {{ 
+                display: flex; 
+                justify-content: space-between; 
+                align-items: center;
+                padding: 15px 20px; 
+                margin-bottom: 20px; 
+                border-radius: 8px; 
+                border: 2px solid {risk_color};
+                background-color: #f4f6f7;
+            }}
+            .risk-score {{ font-size: 36px; font-weight: bold; color: {risk_color}; }}
+            .risk-label {{ font-size: 20px; font-weight: bold; color: #333; }}
+            
+            /* Table Styling */
+            table {{ width: 100%; border-collapse: collapse; margin-top: 10px; }}
+            th, td {{ border: 1px solid #ddd; padding: 12px; text-align: left; font-size: 14px; }}
+            th {{ background-color: #ecf0f1; color: #34495e; }}
+            .value-column {{ font-weight: bold; width: 30%; }}
+
+            /* Action Suggestion Box */
+            .action-suggestion {{
+                background-color: #fcf8e3;
+                border: 1px solid #f9d863;
+                color: #8a6d3b;
+                padding: 15px;
+                margin-top: 15px;
+                border-radius: 5px;
+            }}
+
+            /* Post Content Block */
+            .post-content {{ 
+                background-color: #ecf0f1; 
+                border-left: 5px solid #3498db; 
+                padding: 15px; 
+                margin-top: 10px;
+                white-space: pre-wrap;
+                font-style: italic;
+            }}
+
+            /* Footer */
+            .footer {{ text-align: center; margin-top: 40px; font-size: 12px; color: #7f8c8d; }}
+
+            /* Specific styling for the risk label color */
+            .risk-value {{ color: {risk_color}; }}
+        </style>
+    </head>
+"""
+
+_REPORT_HEAD_BY_BUCKET = {
+    'high': _REPORT_HEAD_TEMPLATE.format(risk_color='#CC0000'), # Red
+    'medium': _REPORT_HEAD_TEMPLATE.format(risk_color='#FFCC00'), # Yellow/Amber
+    'low': _REPORT_HEAD_TEMPLATE.format(risk_color='#008000'), # Green
+}
+
+# Report <body>, filled per report via str.format_map
+_REPORT_BODY_TEMPLATE = """\
+    <body>
+        <div class="container">
+            <div class="header">
+                <h1>🚨 HAWK-EYE AI FORENSIC REPORT</h1>
+                <p>Instant Deception Detector | Generated on: {generated_on}</p>
+            </div>
+
+            <h2>1. Final Impersonation Risk Summary</h2>
+            <div class="risk-summary-box">
+                <div>
+                    <div class="risk-label">Risk Level:</div>
+                    <div class="risk-score risk-value">{risk_label}</div>
+                </div>
+                <div style="text-align: right;">
+                    <div class="risk-label">Calculated Risk Score:</div>
+                    <div class="risk-score risk-value">{final_score}%</div>
+                </div>
+            </div>
+            
+            <div class="action-suggestion">
+                <strong>Action Suggestion:</strong> {suggestion_text}
+            </div>
+
+            <h2>2. Suspect Profile & Reference</h2>
+            <table>
+                <tr>
+                    <th>Field</th>
+                    <th class="value-column">Value</th>
+                </tr>
+                <tr>
+                    <td>*Suspect URL*</td>
+                    <td class="value-column"><a href="{suspect_url}" target="_blank">{suspect_url}</a></td>
+                </tr>
+                <tr>
+                    <td>*Suspect Handle*</td>
+                    <td class="value-column">{suspect_handle}</td>
+                </tr>
+                <tr>
+                    <td>*Official Handle Reference*</td>
+                    <td class="value-column">{official_handle}</td>
+                </tr>
+            </table>
+
+            <h2>3. Detailed Risk Breakdown (Max 100 Points)</h2>
+            <table>
+                <tr>
+                    <th>Risk Factor</th>
+                    <th>Score Detail</th>
+                    <th class="value-column">Points Earned</th>
+                </tr>
+                <tr>
+                    <td>*Identity Risk (Max 45)*</td>
+                    <td>Handle Similarity: {handle_similarity}%</td>
+                    <td class="value-column">{identity_points}</td>
+                </tr>
+                <tr>
+                    <td>*Behavioral Risk (Max 40)*</td>
+                    <td>
+                        Keyword Scan Points: {keyword_points}<br>
+                        *Urgency Tone Points (NEW)*: {urgency_points}
+                    </td>
+                    <td class="value-column">{behavior_points}</td>
+                </tr>
+                <tr>
+                    <td>*Network/Metadata Risk (Max 15)*</td>
+                    <td>
+                        Account Age: {account_age_days} days<br>
+                        Domain Age Risk Points: {domain_age_points}<br>
+                        *Phishing Link Points (NEW)*: {phishing_points}<br>
+                        Stolen Pic Risk Points: {stolen_pic_points}
+                    </td>
+                    <td class="value-column">{network_points}</td>
+                </tr>
+                <tr>
+                    <td style="background-color: #dbe4f1; font-weight: bold;">*AI Confidence Score*</td>
+                    <td style="background-color: #dbe4f1;">Model's certainty in the calculated risk.</td>
+                    <td class="value-column" style="background-color: #dbe4f1;">{confidence}%</td>
+                </tr>
+                <tr style="background-color: #e5e7e9; font-weight: bold;">
+                    <td>*TOTAL RISK SCORE*</td>
+                    <td></td>
+                    <td class="value-column">{final_score} / 100</td>
+                </tr>
+            </table>
+
+            <h2>4. Evidential Content</h2>
+            <p><strong>Recent Post Content Scanned:</strong></p>
+            <div class="post-content">
+                {suspect_posts}
+            </div>
+
+            <div class="footer">
+                This document is a machine-generated forensic snapshot and is intended for official use only.
+            </div>
+        </div>
+    </body>
+    </html>
+    """
+
+def create_html_report(final_score, breakdown, suspect_url, suspect_handle, suspect_posts, suggestion_text, risk_label):
+    """Generates a styled HTML string for the downloadable forensic report."""
+    
+    # Pick the pre-expanded <head> for the report's risk band
+    if final_score >= RISK_THRESHOLD_HIGH:
+        bucket = 'high'
+    elif final_score >= RISK_THRESHOLD_MEDIUM:
+        bucket = 'medium'
+    else:
+        bucket = 'low'
+    
+    confidence = breakdown.get("Confidence Score (%)", "N/A")
+    
+    # Only the body needs per-report formatting
+    return _REPORT_HEAD_BY_BUCKET[bucket] + _REPORT_BODY_TEMPLATE.format_map({
+        "generated_on": time.strftime('%Y-%m-%d %H:%M:%S'),
+        "risk_label": risk_label,
+        "final_score": final_score,
+        "suggestion_text": suggestion_text,
+        "suspect_url": suspect_url,
+        "suspect_handle": suspect_handle,
+        "official_handle": OFFICIAL_HANDLE,
+        "handle_similarity": breakdown.get("Handle Similarity Score (%)"),
+        "identity_points": breakdown.get("Identity Risk Points (Max 45)"),
+        "keyword_points": breakdown.get("Keyword Scan Points (Max 25)"),
+        "urgency_points": breakdown.get("Urgency Tone Points (Max 15)"),
+        "behavior_points": breakdown.get("Behavioral Risk Points (Max 40)"),
+        "account_age_days": breakdown.get("Account Age (Days)"),
+        "domain_age_points": breakdown.get("Domain Age Risk Points"),
+        "phishing_points": breakdown.get("Phishing Link Points"),
+        "stolen_pic_points": breakdown.get("Stolen Picture Risk Points"),
+        "network_points": breakdown.get("Network/Metadata Risk Points (Max 15)"),
+        "confidence": confidence,
+        "suspect_posts": suspect_posts,
+    })
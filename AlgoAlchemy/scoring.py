@@ -0,0 +1,300 @@
+"""
+Hawk-Eye AI scoring engine.
+
+Identity, behavioral and network scoring used by the Streamlit app (app.py).
+Kept free of any UI code so it can be imported by batch pipelines.
+"""
+import functools
+
+import numpy as np
+from rapidfuzz.distance import DamerauLevenshtein
+
+# --- Configuration ---
+OFFICIAL_HANDLE = "Odisha_Police"
+RISK_THRESHOLD_HIGH = 70
+RISK_THRESHOLD_MEDIUM = 40
+
+# Shared generator for the mock scoring jitter
+_RNG = np.random.default_rng()
+
+# Normalised official handle, computed once instead of on every comparison
+_OFFICIAL_LOWER = OFFICIAL_HANDLE.lower().strip()
+# Lookalike characters commonly swapped in for letters in impersonating handles
+_HOMOGLYPH_TT = str.maketrans({'0': 'o', '3': 'e', '4': 'a', '5': 's', '7': 't', '|': 'l', '@': 'a'})
+# Lookalikes with more than one reading; the first reading is the fallback
+_AMBIGUOUS_GLYPHS = {'1': 'il', '!': 'il'}
+
+# Expanded list of fraud keywords (lowercase; matched against lowercased posts)
+FRAUD_KEYWORDS = ("otp", "wallet", "send money", "urgent funds", "transfer now", "fine", "penalty", "account frozen", "kyc update", "click link", "tax refund", "jail")
+
+# Points awarded per categorical UI selection; any other option scores 0
+_URGENCY_POINTS = {
+    "High Urgency (Threat/Panic)": 15,
+    "Medium Urgency (Time Pressure)": 7,
+}
+_DOMAIN_POINTS = {
+    "High Risk (New/Suspicious Domain)": 3,
+    "Medium Risk (Recently Updated Domain)": 1,
+}
+_PHISH_POINTS = {
+    "Homoglyph/Typosquatting Detected": 3,
+    "Malicious Domain Structure Detected": 1,
+}
+_STOLEN_POINTS = {
+    "Yes (Stolen/Official Image Match)": 4,
+}
+
+# --- Helper Functions ---
+
+def _normalise_homoglyphs(suspect_lower):
+    """
+    Maps lookalike characters in a lowercased handle back to letters.
+    Ambiguous glyphs ('1' and '!' can read as 'i' or 'l') take the reading
+    that matches the official handle at the same position; when the lengths
+    differ there is no alignment, so the first reading is used.
+    """
+    text = suspect_lower.translate(_HOMOGLYPH_TT)
+    if not any(ch in _AMBIGUOUS_GLYPHS for ch in text):
+        return text
+
+    aligned = len(text) == len(_OFFICIAL_LOWER)
+    resolved = []
+    for i, ch in enumerate(text):
+        readings = _AMBIGUOUS_GLYPHS.get(ch)
+        if readings is None:
+            resolved.append(ch)
+        elif aligned and _OFFICIAL_LOWER[i] in readings:
+            resolved.append(_OFFICIAL_LOWER[i])
+        else:
+            resolved.append(readings[0])
+    return ''.join(resolved)
+
+@functools.lru_cache(maxsize=1024)
+def get_similarity_score(suspect_handle):
+    """
+    Calculates a score based on handle similarity against OFFICIAL_HANDLE.
+    Max score of 1.0 (100% match) for perfect handle match.
+    Lookalike characters (e.g. '0' (zero) for 'O' (letter), '1' for 'i'
+    or 'l') are normalised first and scored as near-perfect impersonation;
+    other near-misses (swaps, insertions, deletions) are caught via
+    Damerau-Levenshtein similarity.
+    """
+    suspect_lower = suspect_handle.lower().strip()
+
+    if suspect_lower == _OFFICIAL_LOWER:
+        return 1.0
+    
+    # Critical typo: homoglyphs substituted for letters (e.g. '0' zero for 'o')
+    suspect_normalised = _normalise_homoglyphs(suspect_lower)
+    if suspect_normalised == _OFFICIAL_LOWER:
+         return 0.99
+    
+    # Generic near-miss check (substitution, transposition, insertion or deletion)
+    sim = DamerauLevenshtein.normalized_similarity(suspect_normalised, _OFFICIAL_LOWER)
+    if sim >= 0.85:
+        return 0.90
+        
+    return 0.20
+
+
+def keyword_scan_score(post_lower):
+    """
+    Mocks scanning post content for high-risk fraud keywords (Behavioral Module).
+    Expects content that has already been lowercased by the caller.
+    """
+    risk = 0
+    
+    # Specific high-risk phrase detection
+    if "urgent" in post_lower and ("money" in post_lower or "fund" in post_lower):
+        risk += 25  
+    
+    # Generic keyword detection: each keyword found counts once
+    risk += 15 * sum(1 for keyword in FRAUD_KEYWORDS if keyword in post_lower)
+            
+    return risk if risk < 60 else 60 # Max raw risk contribution from generic behavior is 60
+
+def _deterministic_risk(handle, recent_posts, domain_age_risk, profile_pic_stolen, urgency_tone_risk, phishing_link_risk):
+    """Computes the input-dependent (non-random) parts of the risk score."""
+    # 1. Identity Module
+    identity_score = get_similarity_score(handle)
+
+    # 2. Behavioral Module (Max 40 points)
+    posts_lower = recent_posts.lower()
+    behavior_risk_raw = keyword_scan_score(posts_lower)
+    
+    # Feature 1: Urgency Tone (Max 15 points) - NEW
+    urgency_points = _URGENCY_POINTS.get(urgency_tone_risk, 0)
+        
+    # Scale generic keyword score (max 60) to max 25 points, leaving 15 points for Urgency Tone
+    keyword_points = int(behavior_risk_raw * (25 / 60))
+
+    behavior_risk = keyword_points + urgency_points
+    behavior_risk = behavior_risk if behavior_risk < 40 else 40
+    
+    # 3. Network/Metadata Module
+    # Network Feature 1a: External Link Domain Age Check (Max 3 points)
+    domain_age_points = _DOMAIN_POINTS.get(domain_age_risk, 0)
+    
+    # Network Feature 1b: Phishing Link/Homoglyph Check (Max 3 points) - NEW FEATURE
+    phishing_points = _PHISH_POINTS.get(phishing_link_risk, 0)
+    
+    # Network Feature 2: Stolen Profile Picture Check (Max 4 points)
+    stolen_pic_points = _STOLEN_POINTS.get(profile_pic_stolen, 0)
+
+    return identity_score, keyword_points, urgency_points, behavior_risk, domain_age_points, phishing_points, stolen_pic_points
+
+def _aggregate_points(identity_risk, behavior_risk, account_points, domain_age_points, phishing_points, stolen_pic_points, jitter):
+    """Sums the module points into (network_risk, final_score), applying the module and overall caps."""
+    network_risk = account_points + domain_age_points + phishing_points + stolen_pic_points
+    # Ensure network risk maxes out at 15
+    network_risk = network_risk if network_risk < 15 else 15
+
+    final_score_raw = identity_risk + behavior_risk + network_risk
+    jittered = final_score_raw + jitter
+    final_score = 0 if jittered < 0 else (100 if jittered > 100 else jittered)
+    return network_risk, final_score
+
+def calculate_risk_score(handle, recent_posts, is_established_account, domain_age_risk, profile_pic_stolen, urgency_tone_risk, phishing_link_risk):
+    """
+    Calculates the overall Impersonation Risk Score (Max 100) by aggregating scores from all modules.
+    """
+    
+    identity_risk = 0  # Max 45 points
+    network_risk = 0   # Max 15 points
+
+    (identity_score, keyword_points, urgency_points, behavior_risk,
+     domain_age_points, phishing_points, stolen_pic_points) = _deterministic_risk(
+        handle, recent_posts, domain_age_risk, profile_pic_stolen, urgency_tone_risk, phishing_link_risk
+    )
+
+    # Draw every random integer for this analysis in one batched call:
+    # identity spread, established/new account age, new-account points, score jitter
+    identity_spread_max = 2 if identity_score == 0.99 else 5
+    identity_spread, established_age, new_age, new_account_points, jitter = _RNG.integers(
+        [0, 300, 1, 0, -5],
+        [identity_spread_max + 1, 501, 91, 3, 6]
+    ).tolist()
+    
+    # 1. Identity Module (Max 45 points)
+    if identity_score == 1.0:
+        identity_risk = 0
+    elif identity_score == 0.99:
+        # Near perfect match (typo like 0 for O) is highest risk from identity
+        identity_risk = 43 + identity_spread # 43-45
+    elif identity_score == 0.90:
+        # Single character difference
+        identity_risk = 25 + identity_spread # 25-30
+    else:
+        identity_risk = 5 + identity_spread # Low identity risk
+    
+    # Confidence Score Calculation (Mock)
+    if identity_score == 1.0 or identity_score <= 0.20:
+        # High confidence in low/perfect identity match
+        confidence_score = float(_RNG.uniform(90.0, 99.9))
+    elif identity_score >= 0.90:
+        # Lower confidence when dealing with subtle typos
+        confidence_score = float(_RNG.uniform(70.0, 89.9))
+    else:
+        confidence_score = float(_RNG.uniform(50.0, 69.9))
+
+    # 2. Behavioral Module (Max 40 points) is fully deterministic; see _deterministic_risk
+    
+    # 3. Network/Metadata Score (Max 15 points)
+    
+    account_age_days = established_age
+    if not is_established_account:
+        # 5 points for new account (max 5/15)
+        network_risk += 5 + new_account_points
+        account_age_days = new_age
+    
+    # Add a small random jitter and cap the score
+    network_risk, final_score = _aggregate_points(
+        identity_risk, behavior_risk, network_risk,
+        domain_age_points, phishing_points, stolen_pic_points,
+        jitter
+    )
+    
+    return final_score, {
+        "Handle Similarity Score (%)": round(identity_score * 100, 2),
+        "Identity Risk Points (Max 45)": identity_risk,
+        "Keyword Scan Points (Max 25)": keyword_points,
+        "Urgency Tone Points (Max 15)": urgency_points, # NEW
+        "Behavioral Risk Points (Max 40)": behavior_risk,
+        "Network/Metadata Risk Points (Max 15)": network_risk,
+        "Account Age (Days)": account_age_days,
+        "Domain Age Risk Points": domain_age_points,
+        "Phishing Link Points": phishing_points, # NEW
+        "Stolen Picture Risk Points": stolen_pic_points,
+        "Confidence Score (%)": round(confidence_score, 2) 
+    }
+
+def calculate_risk_scores_df(df):
+    """
+    Batch version of calculate_risk_score for bulk analyst review.
+    Expects columns: handle, posts, is_established_account, domain_age_risk,
+    profile_pic_stolen, urgency_tone_risk, phishing_link_risk.
+    is_established_account must be a boolean column; missing handles and posts
+    are scored as empty text.
+    Returns a copy of df with the breakdown columns and "Final Risk Score" added.
+    """
+    # CSV-sourced strings such as "False" are truthy, so refuse to guess
+    if df["is_established_account"].dtype.kind != "b":
+        raise TypeError(f"is_established_account must be a boolean column, got dtype {df['is_established_account'].dtype}")
+
+    out = df.copy()
+    n = len(out)
+    handles = out["handle"].fillna("").astype(str)
+    posts = out["posts"].fillna("").astype(str)
+
+    # 1. Identity Module: handles are few and repeat, so reuse the cached scalar scorer
+    identity_score = handles.map(get_similarity_score).to_numpy(dtype=float)
+
+    # 2. Behavioral Module: one vectorized substring pass per keyword over the whole column
+    posts_lower = posts.str.lower()
+    keyword_hits = sum(posts_lower.str.contains(kw, regex=False).to_numpy(dtype=int) for kw in FRAUD_KEYWORDS)
+    urgent_money = (
+        posts_lower.str.contains("urgent", regex=False)
+        & (posts_lower.str.contains("money", regex=False) | posts_lower.str.contains("fund", regex=False))
+    ).to_numpy(dtype=int)
+    behavior_risk_raw = np.minimum(25 * urgent_money + 15 * keyword_hits, 60)
+    keyword_points = (behavior_risk_raw * (25 / 60)).astype(int)
+    urgency_points = out["urgency_tone_risk"].map(_URGENCY_POINTS).fillna(0).to_numpy(dtype=int)
+    behavior_risk = np.minimum(keyword_points + urgency_points, 40)
+
+    # 3. Network/Metadata Module
+    domain_age_points = out["domain_age_risk"].map(_DOMAIN_POINTS).fillna(0).to_numpy(dtype=int)
+    phishing_points = out["phishing_link_risk"].map(_PHISH_POINTS).fillna(0).to_numpy(dtype=int)
+    stolen_pic_points = out["profile_pic_stolen"].map(_STOLEN_POINTS).fillna(0).to_numpy(dtype=int)
+    is_established = out["is_established_account"].to_numpy(dtype=bool)
+
+    # Random components, drawn per column with the same ranges as the scalar path
+    identity_spread = _RNG.integers(0, np.where(identity_score == 0.99, 3, 6))
+    identity_risk = np.select(
+        [identity_score == 1.0, identity_score == 0.99, identity_score == 0.90],
+        [0, 43 + identity_spread, 25 + identity_spread],
+        5 + identity_spread
+    )
+    high_confidence = (identity_score == 1.0) | (identity_score <= 0.20)
+    confidence_lo = np.where(high_confidence, 90.0, np.where(identity_score >= 0.90, 70.0, 50.0))
+    confidence_hi = np.where(high_confidence, 99.9, np.where(identity_score >= 0.90, 89.9, 69.9))
+    confidence_score = _RNG.uniform(confidence_lo, confidence_hi)
+
+    account_age_days = np.where(is_established, _RNG.integers(300, 501, n), _RNG.integers(1, 91, n))
+    account_points = np.where(is_established, 0, 5 + _RNG.integers(0, 3, n))
+    network_risk = np.minimum(account_points + domain_age_points + phishing_points + stolen_pic_points, 15)
+
+    final_score = np.clip(identity_risk + behavior_risk + network_risk + _RNG.integers(-5, 6, n), 0, 100)
+
+    out["Handle Similarity Score (%)"] = np.round(identity_score * 100, 2)
+    out["Identity Risk Points (Max 45)"] = identity_risk
+    out["Keyword Scan Points (Max 25)"] = keyword_points
+    out["Urgency Tone Points (Max 15)"] = urgency_points
+    out["Behavioral Risk Points (Max 40)"] = behavior_risk
+    out["Network/Metadata Risk Points (Max 15)"] = network_risk
+    out["Account Age (Days)"] = account_age_days
+    out["Domain Age Risk Points"] = domain_age_points
+    out["Phishing Link Points"] = phishing_points
+    out["Stolen Picture Risk Points"] = stolen_pic_points
+    out["Confidence Score (%)"] = np.round(confidence_score, 2)
+    out["Final Risk Score"] = final_score
+    return out
@@ -0,0 +1,63 @@
+import random
+
+import pandas as pd
+import pytest
+
+from scoring import calculate_risk_score, calculate_risk_scores_df
+
+# Breakdown fields that carry no random jitter, so batch and scalar must agree exactly
+DETERMINISTIC_FIELDS = (
+    "Handle Similarity Score (%)",
+    "Keyword Scan Points (Max 25)",
+    "Urgency Tone Points (Max 15)",
+    "Behavioral Risk Points (Max 40)",
+    "Domain Age Risk Points",
+    "Phishing Link Points",
+    "Stolen Picture Risk Points",
+)
+
+
+def _random_rows(n, seed=0):
+    rng = random.Random(seed)
+    return pd.DataFrame({
+        "handle": [rng.choice(["Odisha_Police", "0disha_Police", "Od1sha_Polcie", "foo"]) for _ in range(n)],
+        "posts": [rng.choice(["URGENT send money otp", "hello", "click linkyc update", "fine jail tax refund penalty"]) for _ in range(n)],
+        "is_established_account": [rng.random() < 0.5 for _ in range(n)],
+        "domain_age_risk": [rng.choice(["High Risk (New/Suspicious Domain)", "Medium Risk (Recently Updated Domain)", "Low Risk (Established Domain)"]) for _ in range(n)],
+        "profile_pic_stolen": [rng.choice(["Yes (Stolen/Official Image Match)", "No (Unique/No Match)"]) for _ in range(n)],
+        "urgency_tone_risk": [rng.choice(["High Urgency (Threat/Panic)", "Medium Urgency (Time Pressure)", "Low Urgency (Normal Inquiry)"]) for _ in range(n)],
+        "phishing_link_risk": [rng.choice(["Homoglyph/Typosquatting Detected", "Malicious Domain Structure Detected", "No Suspicion Detected"]) for _ in range(n)],
+    })
+
+
+def test_batch_matches_scalar_scoring():
+    out = calculate_risk_scores_df(_random_rows(200))
+
+    for _, row in out.iterrows():
+        _, breakdown = calculate_risk_score(
+            row["handle"], row["posts"], row["is_established_account"], row["domain_age_risk"],
+            row["profile_pic_stolen"], row["urgency_tone_risk"], row["phishing_link_risk"]
+        )
+        for field in DETERMINISTIC_FIELDS:
+            assert row[field] == breakdown[field], field
+
+    assert out["Final Risk Score"].between(0, 100).all()
+
+
+def test_batch_rejects_non_boolean_account_column():
+    df = _random_rows(3)
+    df["is_established_account"] = ["False", "True", "False"]
+
+    with pytest.raises(TypeError):
+        calculate_risk_scores_df(df)
+
+
+def test_batch_scores_missing_text_as_empty():
+    df = _random_rows(3)
+    df.loc[0, "handle"] = None
+    df.loc[1, "posts"] = None
+
+    out = calculate_risk_scores_df(df)
+
+    assert out.loc[0, "Handle Similarity Score (%)"] == 20.0
+    assert out.loc[1, "Keyword Scan Points (Max 25)"] == 0